@@ -7,27 +7,30 @@
 class Chair {
 public:
     virtual ~Chair() { }
-    virtual std::string sitOn() const  = 0;
+    virtual const std::string& sitOn() const = 0;
 };
 
 class ModernChair : public Chair {
 public:
-    std::string sitOn() const override {
-        return "You can sit on MODERN chair\n";
+    const std::string& sitOn() const override {
+        static const std::string text = "You can sit on MODERN chair\n";
+        return text;
     }
 };
 
 class VictorianChair : public Chair {
 public:
-    std::string sitOn() const override {
-        return "You can sit on VICTORIAN chair\n";
+    const std::string& sitOn() const override {
+        static const std::string text = "You can sit on VICTORIAN chair\n";
+        return text;
     }
 };
 
 class ArtDecoChair : public Chair {
 public: 
-    std::string sitOn() const override {
-        return "You can sit on ARTDECO chair\n";
+    const std::string& sitOn() const override {
+        static const std::string text = "You can sit on ARTDECO chair\n";
+        return text;
     }
 };
 
@@ -38,39 +41,42 @@ public:
 class Sofa {
 public:
     virtual ~Sofa() { }
-    virtual std::string layOn() const  = 0;
+    virtual const std::string& layOn() const = 0;
     virtual std::string putAside(const Chair& collaborator) const = 0; 
 };
 
 class ModernSofa : public Sofa {
 public:
-    std::string layOn() const override {
-        return "You can lie on MODERN Sofa\n";
+    const std::string& layOn() const override {
+        static const std::string text = "You can lie on MODERN Sofa\n";
+        return text;
     }
     std::string putAside(const Chair& collaboratorChair) const override {
-        const std::string result = collaboratorChair.sitOn();
+        const std::string& result = collaboratorChair.sitOn();
         return "Now you can lie on Modern Sofa and " + result;
     }
 };
 
 class VictorianSofa : public Sofa {
 public:
-    std::string layOn() const override {
-        return "You can lie on VICTORIAN Sofa\n";
+    const std::string& layOn() const override {
+        static const std::string text = "You can lie on VICTORIAN Sofa\n";
+        return text;
     }
     std::string putAside(const Chair& collaboratorChair) const override {
-        const std::string result = collaboratorChair.sitOn();
+        const std::string& result = collaboratorChair.sitOn();
         return "Now you can lie on Victorian sofa and " + result;
     }
 };
 
 class ArtDecoSofa : public Sofa {
 public: 
-    std::string layOn() const override {
-        return "You can lie on ARTDECO Sofa\n";
+    const std::string& layOn() const override {
+        static const std::string text = "You can lie on ARTDECO Sofa\n";
+        return text;
     }
     std::string putAside(const Chair& collaboratorChair) const override {
-        const std::string result = collaboratorChair.sitOn();
+        const std::string& result = collaboratorChair.sitOn();
         return "Now you can lie on ArdDeco sofa and " + result;
     }
 };
@@ -78,49 +84,54 @@ public:
 class CoffeeTable {
 public:
     virtual ~CoffeeTable() { }
-    virtual std::string coffeeOnMe() const = 0;
+    virtual const std::string& coffeeOnMe() const = 0;
     virtual std::string sittingOn(const Sofa& collaboratorSofa) const = 0;
 };
 
 class ModernCoffeeTable : public CoffeeTable {
 public:
-    std::string coffeeOnMe() const override {
-        return "You're enjoying a cup of coffee on Modern Coffee Table\n";
+    const std::string& coffeeOnMe() const override {
+        static const std::string text = "You're enjoying a cup of coffee on Modern Coffee Table\n";
+        return text;
     }
     std::string sittingOn(const Sofa& collaboratorSofa) const override {
-        std::string result = collaboratorSofa.layOn();
+        const std::string& result = collaboratorSofa.layOn();
         return result + "Enjoy your coffee on Modern Coffee Table\n";
     }
 };
 
 class VictorianCoffeeTable : public CoffeeTable {
 public:
-    std::string coffeeOnMe() const override {
-        return "You're enjoying a cup of coffee on Victorian Coffee Table\n";
+    const std::string& coffeeOnMe() const override {
+        static const std::string text = "You're enjoying a cup of coffee on Victorian Coffee Table\n";
+        return text;
     }
     std::string sittingOn(const Sofa& collaboratorSofa) const override {
-        std::string result = collaboratorSofa.layOn();
+        const std::string& result = collaboratorSofa.layOn();
         return result + "Enjoy your coffee on Victorian Coffee table\n";
     }
 };
 
 class ArtDecoCoffeeTable : public CoffeeTable {
 public:
-    std::string coffeeOnMe() const override {
-        return "You're enjoying a cup of coffee on ArtDeco coffee table\n";
+    const std::string& coffeeOnMe() const override {
+        static const std::string text = "You're enjoying a cup of coffee on ArtDeco coffee table\n";
+        return text;
     }
     std::string sittingOn(const Sofa& collaboratorSofa) const override {
-        std::string result = collaboratorSofa.layOn();
+        const std::string& result = collaboratorSofa.layOn();
         return result + "Enjoy your coffee on ArtDeco coffee table\n";
     }
 };
 
 // Abstract Factory interface declares a set of methods that return different abstract products
+// Products are stateless, so every factory hands out shared instances instead of allocating new ones
 class FurnitureFactory {
 public:
-    virtual Chair* createChair() const = 0;
-    virtual Sofa* createSofa() const = 0;
-    virtual CoffeeTable* createCoffeeTable() const = 0;
+    virtual ~FurnitureFactory() { }
+    virtual const Chair& createChair() const = 0;
+    virtual const Sofa& createSofa() const = 0;
+    virtual const CoffeeTable& createCoffeeTable() const = 0;
 };
 
 // Concrete Factories produce a family of products that belong to a single variant!
@@ -129,70 +140,73 @@ public:
 // while inside the method a concrete product is instantiated.
 class ModernFurnitureFactory : public FurnitureFactory {
 public:
-    Chair* createChair() const override {
-        return new ModernChair;
+    const Chair& createChair() const override {
+        static const ModernChair chair;
+        return chair;
     }
-    Sofa* createSofa() const override {
-        return new ModernSofa;
+    const Sofa& createSofa() const override {
+        static const ModernSofa sofa;
+        return sofa;
     }
-    CoffeeTable* createCoffeeTable() const override {
-        return new ModernCoffeeTable;
+    const CoffeeTable& createCoffeeTable() const override {
+        static const ModernCoffeeTable coffeeTable;
+        return coffeeTable;
     }
 };
 
 class VictorianFurnitureFactory : public FurnitureFactory {
 public:
-    Chair* createChair() const override {
-        return new VictorianChair;
+    const Chair& createChair() const override {
+        static const VictorianChair chair;
+        return chair;
     }
-    Sofa* createSofa() const override {
-        return new VictorianSofa;
+    const Sofa& createSofa() const override {
+        static const VictorianSofa sofa;
+        return sofa;
     }
-    CoffeeTable* createCoffeeTable() const override {
-        return new VictorianCoffeeTable;
+    const CoffeeTable& createCoffeeTable() const override {
+        static const VictorianCoffeeTable coffeeTable;
+        return coffeeTable;
     }
 };
 
 class ArtDecoFurnitureFactory : public FurnitureFactory {
 public:
-    Chair* createChair() const override {
-        return new ArtDecoChair;
+    const Chair& createChair() const override {
+        static const ArtDecoChair chair;
+        return chair;
     }
-    Sofa* createSofa() const override {
-        return new ArtDecoSofa;
+    const Sofa& createSofa() const override {
+        static const ArtDecoSofa sofa;
+        return sofa;
     }
-    CoffeeTable* createCoffeeTable() const override {
-        return new ArtDecoCoffeeTable;
+    const CoffeeTable& createCoffeeTable() const override {
+        static const ArtDecoCoffeeTable coffeeTable;
+        return coffeeTable;
     }
 };
 
 void ClientCode(const FurnitureFactory& factory) {
-    const Chair* chair = factory.createChair();
-    const Sofa* sofa = factory.createSofa();
-    const CoffeeTable* coffeetable = factory.createCoffeeTable();
-    std::cout<<chair->sitOn();
-    std::cout<<sofa->layOn();
-    std::cout<<sofa->putAside(*chair);
-    std::cout<<coffeetable->coffeeOnMe();
-    std::cout<<coffeetable->sittingOn(*sofa);
-    delete chair;
-    delete sofa;
-    delete coffeetable;
+    const Chair& chair = factory.createChair();
+    const Sofa& sofa = factory.createSofa();
+    const CoffeeTable& coffeetable = factory.createCoffeeTable();
+    std::cout<<chair.sitOn();
+    std::cout<<sofa.layOn();
+    std::cout<<sofa.putAside(chair);
+    std::cout<<coffeetable.coffeeOnMe();
+    std::cout<<coffeetable.sittingOn(sofa);
 }
 
 int main()
 {
     std::cout<<"Client's code testing with the Modern Furniture factory\n";
-    FurnitureFactory* modernFurnitureFactory = new ModernFurnitureFactory;
-    ClientCode(*modernFurnitureFactory);
-    delete modernFurnitureFactory;
+    const ModernFurnitureFactory modernFurnitureFactory;
+    ClientCode(modernFurnitureFactory);
     std::cout<<"\nTesting Victorian Furniture factory\n";
-    FurnitureFactory* victorianFurnitureFactory = new VictorianFurnitureFactory;
-    ClientCode(*victorianFurnitureFactory);
-    delete victorianFurnitureFactory;
+    const VictorianFurnitureFactory victorianFurnitureFactory;
+    ClientCode(victorianFurnitureFactory);
     std::cout<<"\nTesting ArtDeco Furniture factory\n";
-    FurnitureFactory* artDecoFurnitureFactory = new ArtDecoFurnitureFactory;
-    ClientCode(*artDecoFurnitureFactory);
-    delete artDecoFurnitureFactory;
+    const ArtDecoFurnitureFactory artDecoFurnitureFactory;
+    ClientCode(artDecoFurnitureFactory);
     return 0;
 }
\ No newline at end of file
@@ -4,21 +4,23 @@
 class Transport {
 public:
     virtual ~Transport() { }
-    virtual std::string deliver() const = 0;
+    virtual const std::string& deliver() const = 0;
 };
 
 //Concrete Products(Transports) provide various implementation of Product(Transport) interface
 class Truck : public Transport {
 public:
-    std::string deliver() const override {
-        return "Delivering via Truck\n";
+    const std::string& deliver() const override {
+        static const std::string text = "Delivering via Truck\n";
+        return text;
     }
 };
 
 class Ship : public Transport {
 public: 
-    std::string deliver() const override {
-        return "Delivering via Ship\n";
+    const std::string& deliver() const override {
+        static const std::string text = "Delivering via Ship\n";
+        return text;
     }
 };
 
@@ -28,29 +30,30 @@ public:
 class Logistics {
 public: 
     virtual ~Logistics() { }
-    virtual Transport* createTransport() const = 0; // Factory Method
+    virtual const Transport& createTransport() const = 0; // Factory Method
     std::string planDelivery() const {
-        //calling Facotry Method to create a Product object
-        Transport* transport = this->createTransport();
-        std::string result = "The order is " + transport->deliver();
-        delete transport;
-        return result;
+        //calling Facotry Method to get a Product object
+        const Transport& transport = this->createTransport();
+        return "The order is " + transport.deliver();
     }
     //other usefull functions for Logistics
 };
 
 //Concrete Logistics override the factory method in order to change the delivery type
+//Transports are stateless, so a single shared instance is returned instead of a new one per call
 class RoadLogistics : public Logistics {
 public:
-    Transport* createTransport() const override {
-        return new Truck;
+    const Transport& createTransport() const override {
+        static const Truck truck;
+        return truck;
     }
 };
 
 class ShipLogistics : public Logistics {
 public:
-    Transport* createTransport() const override {
-        return new Ship;
+    const Transport& createTransport() const override {
+        static const Ship ship;
+        return ship;
     }
 };
 